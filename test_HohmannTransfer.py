@@ -3,9 +3,19 @@
 import unittest
 from unittest.mock import patch, call
 from math import pi
+from io import StringIO
 import sys
 from HohmannTransfer import HohmannTransfer
 
+_EXPECT_HOHMANN_STR = ('Hohmann transfer from  1000 km altitude to '
+                       '2000 km altitude:\n'
+                       '    1. Wait:       0 seconds to burn: '
+                       '154.7 m/s prograde.\n'
+                       '    2. Wait:    5771 seconds to burn: '
+                       '129.8 m/s prograde.\n')
+
+_EXPECT_HOHMANN_REPR = 'HohmannTransfer(target_sma=2000000.0, delay=100.0)'
+
 
 class Test_environment(unittest.TestCase):
     """Test the environment to ensure it will match production."""
@@ -23,176 +33,148 @@ class Test_HohmannTransfer_init(unittest.TestCase):
         - active vessel
     """
 
-    def test_no_krpc_connection(self):
+    @patch('krpc.connect', side_effect=ConnectionRefusedError)
+    def test_no_krpc_connection(self, mock_conn):
         """Server unreachable should raise ConnectionRefusedError."""
-        try:
+        with self.assertRaises(ConnectionRefusedError):
             HohmannTransfer()
-        except Exception as e:
-            self.assertIsInstance(e, ConnectionRefusedError)
-        return
 
-    @patch('krpc.connect', spec=True)
+    @patch('krpc.connect')
     def test_krpc_connection(self, mock_conn):
         """Check that __init__ connects to KRPC server."""
         HohmannTransfer()
 
         mock_conn.assert_called_once_with(name='HohmannTransfer')
 
-    @patch('krpc.connect', spec=True)
-    def test_init_target_sma_no_karg(self, mock_conn):
-        """Check that __init__ w/o karg sets target_sma to inital_sma."""
+    @patch('krpc.connect')
+    def test_init_kwargs(self, mock_conn):
+        """Check that __init__ sets target_sma & delay, with defaults."""
         mock_conn().space_center.active_vessel.orbit.semi_major_axis = 10
 
-        transfer = HohmannTransfer()
-
-        self.assertEqual(transfer.target_sma, 10)
-
-    @patch('krpc.connect', spec=True)
-    def test_init_target_sma(self, mock_conn):
-        """Check that __init__ with target_sma karg sets it."""
-        transfer = HohmannTransfer(target_sma=10)
-
-        self.assertEqual(transfer.target_sma, 10)
-
-    @patch('krpc.connect', spec=True)
-    def test_init_delay_no_karg(self, mock_conn):
-        """Check that __init__ w/o karg sets delay to zero."""
-        transfer = HohmannTransfer()
+        values = [[{}, 'target_sma', 10],
+                  [{'target_sma': 20}, 'target_sma', 20],
+                  [{}, 'delay', 0],
+                  [{'delay': 10}, 'delay', 10], ]
 
-        self.assertEqual(transfer.delay, 0)
+        for kwargs, attribute, result in values:
+            with self.subTest(kwargs=kwargs, attribute=attribute):
+                transfer = HohmannTransfer(**kwargs)
+                self.assertEqual(getattr(transfer, attribute), result)
 
-    @patch('krpc.connect', spec=True)
-    def test_init_delay(self, mock_conn):
-        """Check that __init__ with delay karg sets it."""
-        transfer = HohmannTransfer(delay=10)
 
-        self.assertEqual(transfer.delay, 10)
-
-
-@patch('krpc.connect', spec=True)
 class Test_HohmannTransfer_ro_attributes(unittest.TestCase):
     """
     Test the HohmannTransfer class read-only attributes.
 
     Requires a patch on the KRPC server connection for:
         - active vessel
+
+    The read-only attributes are computed on access from the active vessel
+    & from target_sma, so a single patch and a single transfer are shared by
+    the class, and setUp restores target_sma & delay before each test.
     """
 
-    def test_initial_sma(self, mock_conn):
+    @classmethod
+    def setUpClass(cls):
+        """Patch the KRPC server connection & create the shared transfer."""
+        cls.patcher = patch('krpc.connect')
+        cls.mock_conn = cls.patcher.start()
+        cls.vessel = cls.mock_conn.return_value.space_center.active_vessel
+        try:
+            cls.transfer = HohmannTransfer()
+        except Exception:
+            cls.patcher.stop()
+            raise
+        cls.target_sma0 = cls.transfer.target_sma
+        cls.delay0 = cls.transfer.delay
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the patch on the KRPC server connection."""
+        cls.patcher.stop()
+
+    def setUp(self):
+        """Reset the shared connection mock & the transfer's target."""
+        self.mock_conn.reset_mock()
+        self.transfer.target_sma = self.target_sma0
+        self.transfer.delay = self.delay0
+
+    def test_initial_sma(self):
         """Check that inital_sma is set from active vessel."""
-        mock_conn().space_center.active_vessel.orbit.semi_major_axis = 10
-
-        transfer = HohmannTransfer()
+        self.vessel.orbit.semi_major_axis = 10
 
-        self.assertEqual(transfer.initial_sma, 10)
+        self.assertEqual(self.transfer.initial_sma, 10)
 
-    def test_transfer_sma(self, mock_conn):
+    def test_transfer_sma(self):
         """Check that transfer_sma is the average of initial & target smas."""
-        mock_conn().space_center.active_vessel.orbit.semi_major_axis = 10
+        self.vessel.orbit.semi_major_axis = 10
+        self.transfer.target_sma = 30
 
-        transfer = HohmannTransfer(target_sma=30)
+        self.assertEqual(self.transfer.transfer_sma, 20)
 
-        self.assertEqual(transfer.transfer_sma, 20)
-
-    def test_mu(self, mock_conn):
+    def test_mu(self):
         """Check that gravitational parameter is set from active vessel."""
-        vessel = mock_conn().space_center.active_vessel
-        vessel.orbit.body.gravitational_parameter = 10
+        self.vessel.orbit.body.gravitational_parameter = 10
 
-        transfer = HohmannTransfer()
+        self.assertEqual(self.transfer.mu, 10)
 
-        self.assertEqual(transfer.mu, 10)
-
-    def test_initial_altitude(self, mock_conn):
+    def test_initial_altitude(self):
         """Check that initial_altitude is set from active vessel."""
-        vessel = mock_conn().space_center.active_vessel
-        vessel.orbit.semi_major_axis = 10
-        vessel.orbit.body.equatorial_radius = 1
+        self.vessel.orbit.semi_major_axis = 10
+        self.vessel.orbit.body.equatorial_radius = 1
 
-        transfer = HohmannTransfer()
+        self.assertEqual(self.transfer.initial_altitude, 9)
 
-        self.assertEqual(transfer.initial_altitude, 9)
+    def _set_orbits(self, initial_sma, mu, target_sma):
+        """Set the vessel's orbit & the transfer's target."""
+        self.vessel.orbit.semi_major_axis = initial_sma
+        self.vessel.orbit.body.gravitational_parameter = mu
+        self.transfer.target_sma = target_sma
 
-    def test_initial_dV(self, mock_conn):
+    def test_initial_dV(self):
         """Check that initial_dV is set from active vessel & target_sma."""
-        vessel = mock_conn().space_center.active_vessel
-        vessel.orbit.semi_major_axis = 2
-        vessel.orbit.body.gravitational_parameter = 8
+        self._set_orbits(initial_sma=2, mu=8, target_sma=16)
 
-        transfer = HohmannTransfer(target_sma=16)
+        self.assertAlmostEqual(self.transfer.initial_dV, 2/3)
 
-        self.assertAlmostEqual(transfer.initial_dV, 2/3)
-
-    def test_final_dV(self, mock_conn):
+    def test_final_dV(self):
         """Check that final_dV is set from active vessel & target_sma."""
-        vessel = mock_conn().space_center.active_vessel
-        vessel.orbit.semi_major_axis = 16
-        vessel.orbit.body.gravitational_parameter = 8
-
-        transfer = HohmannTransfer(target_sma=2)
-
-        self.assertAlmostEqual(transfer.final_dV, -2/3)
-
-    def test_initial_period(self, mock_conn):
-        """Check that initial_period is set from active vessel."""
-        vessel = mock_conn().space_center.active_vessel
-        vessel.orbit.semi_major_axis = 4
-        vessel.orbit.body.gravitational_parameter = 1
+        self._set_orbits(initial_sma=16, mu=8, target_sma=2)
 
-        transfer = HohmannTransfer()
-
-        self.assertAlmostEqual(transfer.initial_period, 16*pi)
+        self.assertAlmostEqual(self.transfer.final_dV, -2/3)
 
-    def test_transfer_period(self, mock_conn):
-        """Should set transfer_period from active vessel & target_sma."""
-        vessel = mock_conn().space_center.active_vessel
-        vessel.orbit.semi_major_axis = 2
-        vessel.orbit.body.gravitational_parameter = 1
+    def test_initial_and_relative_period(self):
+        """Should set initial & relative periods from vessel & target_sma."""
+        self._set_orbits(initial_sma=4, mu=1, target_sma=9)
 
-        transfer = HohmannTransfer(target_sma=6)
+        with self.subTest('initial_period'):
+            self.assertAlmostEqual(self.transfer.initial_period, 16*pi)
+        with self.subTest('relative_period'):
+            self.assertAlmostEqual(self.transfer.relative_period,
+                                   pi*16*54/(16-54))
 
-        self.assertAlmostEqual(transfer.transfer_period, 16*pi)
-
-    def test_transfer_time(self, mock_conn):
-        """Should set transfer_time from active vessel & target_sma."""
-        vessel = mock_conn().space_center.active_vessel
-        vessel.orbit.semi_major_axis = 2
-        vessel.orbit.body.gravitational_parameter = 1
+    def test_transfer_period_and_time(self):
+        """Should set transfer period & time from vessel & target_sma."""
+        self._set_orbits(initial_sma=2, mu=1, target_sma=6)
 
-        transfer = HohmannTransfer(target_sma=6)
+        with self.subTest('transfer_period'):
+            self.assertAlmostEqual(self.transfer.transfer_period, 16*pi)
+        with self.subTest('transfer_time'):
+            self.assertAlmostEqual(self.transfer.transfer_time, 8*pi)
 
-        self.assertAlmostEqual(transfer.transfer_time, 8*pi)
-
-    def test_relative_period(self, mock_conn):
-        """Should set relative_period from active vessel & target_sma."""
-        vessel = mock_conn().space_center.active_vessel
-        vessel.orbit.semi_major_axis = 4
-        vessel.orbit.body.gravitational_parameter = 1
-
-        transfer = HohmannTransfer(target_sma=9)
-
-        self.assertAlmostEqual(transfer.relative_period, pi*16*54/(16-54))
-
-    def test_initial_phase(self, mock_conn):
+    def test_initial_phase(self):
         """Check that initial_phase is set from active vessel."""
-        mock_conn().space_center.active_vessel.flight().longitude = 20
-
-        transfer = HohmannTransfer()
+        self.vessel.flight().longitude = 20
 
-        self.assertEqual(transfer.initial_phase, 20)
+        self.assertEqual(self.transfer.initial_phase, 20)
 
-    def test_phase_change(self, mock_conn):
+    def test_phase_change(self):
         """Check that phase_change is set from active vessel & target_sma."""
-        vessel = mock_conn().space_center.active_vessel
-        vessel.orbit.semi_major_axis = 2
-        vessel.orbit.body.gravitational_parameter = 1
+        self._set_orbits(initial_sma=2, mu=1, target_sma=3)
 
-        transfer = HohmannTransfer(target_sma=3)
+        self.assertAlmostEqual(self.transfer.phase_change, 43.0693606237085)
 
-        self.assertAlmostEqual(transfer.phase_change, 43.0693606237085)
 
-
-@patch('krpc.connect', spec=True)
 class Test_HohmannTransfer_rw_attributes(unittest.TestCase):
     """
     Test the HohmannTransfer class read/write attributes.
@@ -201,23 +183,30 @@ class Test_HohmannTransfer_rw_attributes(unittest.TestCase):
         - active vessel
     """
 
-    def test_target_sma(self, mock_conn):
-        """Check that target_sma can be set."""
-        transfer = HohmannTransfer()
-        transfer.target_sma = 10
+    @classmethod
+    def setUpClass(cls):
+        """Patch the KRPC server connection & bind its active vessel."""
+        cls.patcher = patch('krpc.connect')
+        cls.mock_conn = cls.patcher.start()
+        cls.vessel = cls.mock_conn.return_value.space_center.active_vessel
 
-        self.assertEqual(transfer.target_sma, 10)
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the patch on the KRPC server connection."""
+        cls.patcher.stop()
 
-    def test_delay(self, mock_conn):
-        """Check that target_sma can be set."""
+    def test_target_sma_and_delay(self):
+        """Check that target_sma & delay can be set."""
         transfer = HohmannTransfer()
-        transfer.delay = 10
 
-        self.assertEqual(transfer.delay, 10)
+        for attribute in ['target_sma', 'delay']:
+            with self.subTest(attribute=attribute):
+                setattr(transfer, attribute, 10)
+                self.assertEqual(getattr(transfer, attribute), 10)
 
-    def test_target_altitude(self, mock_conn):
+    def test_target_altitude(self):
         """Check that target_altitude sets target_sma."""
-        mock_conn().space_center.active_vessel.orbit.body.equatorial_radius = 1
+        self.vessel.orbit.body.equatorial_radius = 1
 
         transfer = HohmannTransfer()
         transfer.target_altitude = 10
@@ -225,10 +214,9 @@ class Test_HohmannTransfer_rw_attributes(unittest.TestCase):
         self.assertEqual(transfer.target_altitude, 10)
         self.assertEqual(transfer.target_sma, 11)
 
-    def test_target_period(self, mock_conn):
+    def test_target_period(self):
         """Check that target_period sets target_sma."""
-        vessel = mock_conn().space_center.active_vessel
-        vessel.orbit.body.gravitational_parameter = 1
+        self.vessel.orbit.body.gravitational_parameter = 1
 
         transfer = HohmannTransfer()
         transfer.target_period = 16*pi
@@ -236,43 +224,35 @@ class Test_HohmannTransfer_rw_attributes(unittest.TestCase):
         self.assertAlmostEqual(transfer.target_period, 16*pi)
         self.assertAlmostEqual(transfer.target_sma, 4)
 
-    def test_target_phase(self, mock_conn):
+    def test_target_phase(self):
         """Check that target_phase sets itself (clamped) as well as delay."""
-        vessel = mock_conn().space_center.active_vessel
-        vessel.orbit.semi_major_axis = 2
-        vessel.orbit.body.gravitational_parameter = 1
-        vessel.flight().longitude = 10
+        self.vessel.orbit.semi_major_axis = 2
+        self.vessel.orbit.body.gravitational_parameter = 1
+        self.vessel.flight().longitude = 10
 
         transfer = HohmannTransfer(target_sma=3)
 
-        target_phase_baseline = transfer.initial_phase + transfer.phase_change
+        baseline = transfer.initial_phase + transfer.phase_change
+        rp = abs(transfer.relative_period)
         with self.subTest('Target already in position.'):
-            transfer.target_phase = target_phase_baseline
-            self.assertAlmostEqual(transfer.target_phase,
-                                   target_phase_baseline)
-            self.assertAlmostEqual(transfer.delay,
-                                   0)
+            transfer.target_phase = baseline
+            self.assertAlmostEqual(transfer.target_phase, baseline)
+            self.assertAlmostEqual(transfer.delay, 0)
         with self.subTest('Target 90 degrees ahead.'):
-            transfer.target_phase = 90 + target_phase_baseline
-            self.assertAlmostEqual(transfer.target_phase,
-                                   90 + target_phase_baseline)
-            self.assertAlmostEqual(transfer.delay,
-                                   0.25 * abs(transfer.relative_period))
+            transfer.target_phase = 90 + baseline
+            self.assertAlmostEqual(transfer.target_phase, 90 + baseline)
+            self.assertAlmostEqual(transfer.delay, 0.25 * rp)
         with self.subTest('Target 90 degrees behind.'):
-            transfer.target_phase = -90 + target_phase_baseline
-            self.assertAlmostEqual(transfer.target_phase,
-                                   270 + target_phase_baseline)
-            self.assertAlmostEqual(transfer.delay,
-                                   0.75 * abs(transfer.relative_period))
+            transfer.target_phase = -90 + baseline
+            self.assertAlmostEqual(transfer.target_phase, 270 + baseline)
+            self.assertAlmostEqual(transfer.delay, 0.75 * rp)
         with self.subTest('Target a full turn & a third degrees ahead.'):
-            transfer.target_phase = 480 + target_phase_baseline
-            self.assertAlmostEqual(transfer.target_phase,
-                                   120 + target_phase_baseline)
-            self.assertAlmostEqual(transfer.delay,
-                                   1/3 * abs(transfer.relative_period))
+            transfer.target_phase = 480 + baseline
+            self.assertAlmostEqual(transfer.target_phase, 120 + baseline)
+            self.assertAlmostEqual(transfer.delay, 1/3 * rp)
 
 
-@patch('krpc.connect', spec=True)
+@patch('krpc.connect')
 class Test_HohmannTransfer_private_methods(unittest.TestCase):
     """
     Test the HohmannTransfer class representations methods.
@@ -303,9 +283,11 @@ class Test_HohmannTransfer_private_methods(unittest.TestCase):
         """Check that clamp_to() works."""
         transfer = HohmannTransfer()
 
-        self.assertEqual(transfer.clamp_to(-10, 360), 350)
-        self.assertEqual(transfer.clamp_to(20, 360), 20)
-        self.assertEqual(transfer.clamp_to(390, 360), 30)
+        values = [[-10, 350], [20, 20], [390, 30], ]
+
+        self.assertSequenceEqual(
+            [transfer.clamp_to(angle, 360) for angle, _ in values],
+            [result for _, result in values])
 
     def test_str(self, mock_conn):
         """Check that the __str__() method works."""
@@ -316,25 +298,16 @@ class Test_HohmannTransfer_private_methods(unittest.TestCase):
 
         actual_str = str(HohmannTransfer(target_sma=2*10**6))
 
-        expect_str = 'Hohmann transfer from  1000 km altitude to '
-        expect_str += '2000 km altitude:\n'
-        expect_str += '    1. Wait:       0 seconds to burn: '
-        expect_str += '154.7 m/s prograde.\n'
-        expect_str += '    2. Wait:    5771 seconds to burn: '
-        expect_str += '129.8 m/s prograde.\n'
-
-        self.assertEqual(actual_str, expect_str)
+        self.assertEqual(actual_str, _EXPECT_HOHMANN_STR)
 
     def test_repr(self, mock_conn):
         """Check that the __repr__() method works."""
         actual_str = repr(HohmannTransfer(target_sma=2000000.0, delay=100.0))
 
-        expect_str = 'HohmannTransfer(target_sma=2000000.0, delay=100.0)'
-
-        self.assertEqual(actual_str, expect_str)
+        self.assertEqual(actual_str, _EXPECT_HOHMANN_REPR)
 
 
-@patch('krpc.connect', spec=True)
+@patch('krpc.connect')
 class Test_HohmannTransfer_use_cases(unittest.TestCase):
     """
     Test the HohmannTransfer class use case methods.
@@ -352,24 +325,25 @@ class Test_HohmannTransfer_use_cases(unittest.TestCase):
         transfer = HohmannTransfer()
 
         with self.subTest('Does not raise AttributeError'):
-            with patch('sys.stdout') as mock_stdout:
+            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
                 try:
                     transfer.transfer_to_rendezvous()
                 except AttributeError:
                     self.fail('Should have caught the AttributeError')
 
-        calls = [call('No target found: transfer unchanged.')]
         with self.subTest('Writes warning to stdout'):
-            mock_stdout.write.assert_has_calls(calls)
+            self.assertEqual(mock_stdout.getvalue(),
+                             'No target found: transfer unchanged.\n')
 
     def test_transfer_to_rendezvous(self, mock_conn):
         """Should set target_sma & delay with a target."""
-        vessel = mock_conn().space_center.active_vessel
+        space_center = mock_conn().space_center
+        vessel = space_center.active_vessel
         vessel.orbit.semi_major_axis = 4
         vessel.orbit.body.gravitational_parameter = 1
         vessel.flight().longitude = 0
 
-        target = mock_conn().space_center.target_vessel
+        target = space_center.target_vessel
         target.orbit.semi_major_axis = 9
         target.flight().longitude = 20
 
@@ -393,10 +367,11 @@ class Test_HohmannTransfer_use_cases(unittest.TestCase):
 
     def test_add_nodes(self, mock_conn):
         """Should call KRPC's add_node() twice with the correct kargs."""
-        vessel = mock_conn().space_center.active_vessel
+        space_center = mock_conn().space_center
+        vessel = space_center.active_vessel
         vessel.orbit.semi_major_axis = 2
         vessel.orbit.body.gravitational_parameter = 1
-        mock_conn().space_center.ut = 0
+        space_center.ut = 0
 
         transfer = HohmannTransfer(target_sma=3)
         transfer.add_nodes()
@@ -406,8 +381,7 @@ class Test_HohmannTransfer_use_cases(unittest.TestCase):
                         call(prograde=transfer.final_dV,
                              ut=transfer.transfer_time)]
 
-        control = mock_conn().space_center.active_vessel.control
-        control.add_node.assert_has_calls(expect_calls)
+        vessel.control.add_node.assert_has_calls(expect_calls)
 
 
 if __name__ == '__main__':
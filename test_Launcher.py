@@ -5,10 +5,36 @@ Full coverage achieved, refactoring for readability & efficiency ongoing.
 """
 
 import unittest
-from unittest.mock import patch, call
+from unittest.mock import patch, call, sentinel, Mock
 import sys
 from Launcher import Launcher
 
+_EXPECT_LAUNCHER_STR = ('Will launch to 1.0km  '
+                        'and set up the circularization maneuver node.\n')
+
+_EXPECT_LAUNCHER_REPR = ('Launcher(target_altitude=1000, '
+                         'target_inclination=20)')
+
+# (altitude, ascent_angle)
+_ASCENT_ANGLE_VALUES = ((0, 90),
+                        (1000, 90),
+                        (1001, 80),
+                        (25500, 40),
+                        (50000, 0), )
+
+# (new_thrust, calls_made)
+_AUTO_STAGE_VALUES = ((95, False),
+                      (89, True),
+                      (50, True),
+                      (25, True), )
+
+
+def _50_once_then_100():
+    """Yield 50 once, then 100 forever, to drive the ascent stream mocks."""
+    yield 50
+    while True:
+        yield 100
+
 
 class Test_environment(unittest.TestCase):
     """Test the environment to ensure it will match production."""
@@ -26,48 +52,67 @@ class Test_Launcher_init(unittest.TestCase):
         - active vessel
     """
 
-    def test_no_krpc_connection(self):
+    @patch('krpc.connect', side_effect=ConnectionRefusedError)
+    def test_no_krpc_connection(self, mock_conn):
         """Server unreachable should raise ConnectionRefusedError."""
-        try:
+        with self.assertRaises(ConnectionRefusedError):
             Launcher(target_altitude=10)
-        except Exception as e:
-            self.assertIsInstance(e, ConnectionRefusedError)
-        return
 
-    @patch('krpc.connect', spec=True)
+    @patch('krpc.connect')
     def test_krpc_connection(self, mock_conn):
         """Check that __init__ connects to KRPC server."""
         Launcher(target_altitude=10)
 
         mock_conn.assert_called_once_with(name='Launcher')
 
-    @patch('krpc.connect', spec=True)
+    @patch('krpc.connect')
     def test_init_without_arg(self, mock_conn):
         """Invoking w/o arg should raise TypeError."""
-        try:
+        with self.assertRaises(TypeError):
             Launcher()
-        except Exception as e:
-            self.assertIsInstance(e, TypeError)
-        return
-
-    @patch('krpc.connect', spec=True)
-    def test_init_with_arg(self, mock_conn):
-        """Invoking w/ arg should set altitude & default inclination."""
-        capcom = Launcher(target_altitude=10)
-        self.assertEqual(capcom.target_altitude, 10)
-        self.assertEqual(capcom.target_inclination, 0)
-
-    @patch('krpc.connect', spec=True)
-    def test_init_with_optional_karg(self, mock_conn):
-        """Invoking w/ karg should set altitude & inclination."""
-        capcom = Launcher(target_altitude=10,
-                          target_inclination=90)
-        self.assertEqual(capcom.target_altitude, 10)
-        self.assertEqual(capcom.target_inclination, 90)
+
+    @patch('krpc.connect')
+    def test_init_with_args(self, mock_conn):
+        """Invoking w/ arg (& karg) should set altitude & inclination."""
+        with self.subTest('default inclination'):
+            capcom = Launcher(target_altitude=10)
+            self.assertEqual(capcom.target_altitude, 10)
+            self.assertEqual(capcom.target_inclination, 0)
+
+        with self.subTest('optional inclination'):
+            capcom = Launcher(target_altitude=10,
+                              target_inclination=90)
+            self.assertEqual(capcom.target_altitude, 10)
+            self.assertEqual(capcom.target_inclination, 90)
+
+
+class _LauncherTestCase(unittest.TestCase):
+    """Share one patched KRPC connection & Launcher across a test class."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Patch the KRPC server connection & create the shared Launcher."""
+        cls.patcher = patch('krpc.connect')
+        cls.mock_conn = cls.patcher.start()
+        cls.conn = cls.mock_conn.return_value
+        cls.vessel = cls.conn.space_center.active_vessel
+        try:
+            cls.capcom = Launcher(target_altitude=10)
+        except Exception:
+            cls.patcher.stop()
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the patch on the KRPC server connection."""
+        cls.patcher.stop()
+
+    def setUp(self):
+        """Clear calls recorded by previous tests on the shared mocks."""
+        self.mock_conn.reset_mock()
 
 
-@patch('krpc.connect', spec=True)
-class Test_Launcher_private_methods(unittest.TestCase):
+class Test_Launcher_private_methods(_LauncherTestCase):
     """
     Test the Launcher class private methods.
 
@@ -75,72 +120,54 @@ class Test_Launcher_private_methods(unittest.TestCase):
         - active vessel
     """
 
-    def test__ascent_angle_manager(self, mock_conn):
-        """Should set autopilot ascent angle from altitude."""
-        capcom = Launcher(target_altitude=10)
-
-        values = [[0, 90],
-                  [1000, 90],
-                  [1001, 80],
-                  [25500, 40],
-                  [50000, 0],
-                  ]
+    def setUp(self):
+        """Reset the shared fixture & patch time for each test."""
+        super().setUp()
+        patcher = patch('Launcher.time', spec=True)
+        self.mock_time = patcher.start()
+        self.addCleanup(patcher.stop)
 
-        for altitude, ascent_angle in values:
-            capcom._ascent_angle_manager(altitude=altitude)
-            auto_pilot = mock_conn().space_center.active_vessel.auto_pilot
-            self.assertAlmostEqual(auto_pilot.target_pitch, ascent_angle, 0)
-
-    @patch('Launcher.time', spec=True)
-    def test__auto_stage(self, mock_time, mock_conn):
+    def test__ascent_angle_manager(self):
+        """Should set autopilot ascent angle from altitude."""
+        auto_pilot = self.vessel.auto_pilot
+        for altitude, ascent_angle in _ASCENT_ANGLE_VALUES:
+            with self.subTest(altitude=altitude):
+                self.capcom._ascent_angle_manager(altitude=altitude)
+                self.assertAlmostEqual(auto_pilot.target_pitch,
+                                       ascent_angle, 0)
+
+    def test__auto_stage(self):
         """Should return available_thrust, with side effect of staging."""
-        capcom = Launcher(target_altitude=10)
-        vessel = mock_conn().space_center.active_vessel
-        control = vessel.control
-
-        VALUES = [[95, False],
-                  [89, True],
-                  [50, True],
-                  [25, True], ]
+        control = self.vessel.control
+        mock_time = self.mock_time
 
-        for new_thrust, calls_made in VALUES:
+        for new_thrust, calls_made in _AUTO_STAGE_VALUES:
             with self.subTest(f'thrust_ratio: {new_thrust}%'):
-                mock_conn().reset_mock()
-                mock_time.reset_mock()
-                vessel.available_thrust = new_thrust
-                self.assertEqual(capcom._auto_stage(100), new_thrust)
+                control.activate_next_stage = Mock()
+                mock_time.sleep = Mock()
+                self.vessel.available_thrust = new_thrust
+                self.assertEqual(self.capcom._auto_stage(100), new_thrust)
                 if calls_made:
                     control.activate_next_stage.assert_called_once_with()
                     mock_time.sleep.assert_has_calls([call(0.1), call(0.1)])
                 else:
                     mock_time.sleep.assert_not_called()
 
-    def test__wait_to_go_around_again(self, mock_conn):
+    def test__wait_to_go_around_again(self):
         """Check it calls time.sleep() for 10 ms."""
-        capcom = Launcher(target_altitude=10)
-
-        with patch('Launcher.time', spec=True) as mock_time:
-            capcom._wait_to_go_around_again()
-            mock_time.sleep.assert_called_once_with(0.01)
-
-    def test___str__(self, mock_conn):
-        """Check that the __str__() method works."""
-        actual_str = str(Launcher(target_altitude=1000))
-        expect_str = 'Will launch to 1.0km  '
-        expect_str += 'and set up the circularization maneuver node.\n'
-        self.assertEqual(actual_str, expect_str)
-
-    def test___repr__(self, mock_conn):
-        """Check that the __repr__() method works."""
-        actual_str = repr(Launcher(target_altitude=10,
-                                   target_inclination=20))
-        expect_str = 'Launcher(target_altitude=10, '
-        expect_str += 'target_inclination=20)'
-        self.assertEqual(actual_str, expect_str)
-
-
-@patch('krpc.connect', spec=True)
-class Test_Launcher_public_methods(unittest.TestCase):
+        self.capcom._wait_to_go_around_again()
+        self.mock_time.sleep.assert_called_once_with(0.01)
+
+    def test_string_representations(self):
+        """Check that the __str__() & __repr__() methods work."""
+        capcom = Launcher(target_altitude=1000, target_inclination=20)
+        with self.subTest('__str__'):
+            self.assertEqual(str(capcom), _EXPECT_LAUNCHER_STR)
+        with self.subTest('__repr__'):
+            self.assertEqual(repr(capcom), _EXPECT_LAUNCHER_REPR)
+
+
+class Test_Launcher_public_methods(_LauncherTestCase):
     """
     Test the Launcher class public methods.
 
@@ -148,42 +175,40 @@ class Test_Launcher_public_methods(unittest.TestCase):
         - active vessel
     """
 
-    def test_ignition(self, mock_conn):
+    @patch('Launcher.time', spec=True)
+    def test_ignition(self, mock_time):
         """Should engage autopilot, wait, & stage."""
         capcom = Launcher(target_altitude=10,
                           target_inclination=30)
-        vessel = mock_conn().space_center.active_vessel
-        vessel.control.sas = True
-        vessel.control.rcs = True
-        vessel.control.throttle = 0.0
-        vessel.surface_reference_frame = 'RF'
-
-        with patch('Launcher.time', spec=True) as mock_time:
-            vessel.auto_pilot.engage.assert_not_called()
-            vessel.control.activate_next_stage.assert_not_called()
-            mock_time.sleep.assert_not_called()
-            capcom.ignition()
-            self.assertEqual(vessel.auto_pilot.target_pitch, 90)
-            self.assertEqual(vessel.auto_pilot.target_heading, 90-30)
-            self.assertEqual(vessel.auto_pilot.target_roll, 180)
-            self.assertEqual(vessel.auto_pilot.reference_frame, 'RF')
-            self.assertIs(vessel.control.sas, False)
-            self.assertIs(vessel.control.rcs, False)
-            self.assertAlmostEqual(vessel.control.throttle, 1.0)
-            vessel.auto_pilot.engage.assert_called_once_with()
-            vessel.control.activate_next_stage.assert_called_once_with()
-            mock_time.sleep.assert_called_once_with(1)
-
-    def test_ascent(self, mock_conn):
+        vessel = self.conn.space_center.active_vessel
+        auto_pilot = vessel.auto_pilot
+        control = vessel.control
+        control.sas = True
+        control.rcs = True
+        control.throttle = 0.0
+        vessel.surface_reference_frame = sentinel.RF
+
+        auto_pilot.engage.assert_not_called()
+        control.activate_next_stage.assert_not_called()
+        mock_time.sleep.assert_not_called()
+        capcom.ignition()
+        self.assertEqual(auto_pilot.target_pitch, 90)
+        self.assertEqual(auto_pilot.target_heading, 90-30)
+        self.assertEqual(auto_pilot.target_roll, 180)
+        self.assertIs(auto_pilot.reference_frame, sentinel.RF)
+        self.assertIs(control.sas, False)
+        self.assertIs(control.rcs, False)
+        self.assertAlmostEqual(control.throttle, 1.0)
+        auto_pilot.engage.assert_called_once_with()
+        control.activate_next_stage.assert_called_once_with()
+        mock_time.sleep.assert_called_once_with(1)
+
+    def test_ascent(self):
         """Should manage the ascent until apoapsis is reached."""
-        def _80_once_then_100():
-            yield 50
-            while True:
-                yield 100
-
         capcom = Launcher(target_altitude=80)
-        mock_conn().stream().__enter__().side_effect = _80_once_then_100()
-        vessel = mock_conn().space_center.active_vessel
+        stream_ctx = self.conn.stream.return_value.__enter__.return_value
+        stream_ctx.side_effect = _50_once_then_100()
+        vessel = self.conn.space_center.active_vessel
         vessel.control.throttle = 1.0
         vessel.available_thrust = 20
 
@@ -196,31 +221,30 @@ class Test_Launcher_public_methods(unittest.TestCase):
             capcom._wait_to_go_around_again.assert_called_once_with()
             self.assertAlmostEqual(vessel.control.throttle, 0.0)
 
-    def test_setup_circularization(self, mock_conn):
+    def test_setup_circularization(self):
         """Should add the circularization maneuver node."""
-        vessel = mock_conn().space_center.active_vessel
+        space_center = self.conn.space_center
+        vessel = space_center.active_vessel
         vessel.orbit.body.gravitational_parameter = 1
         vessel.orbit.apoapsis = 200
         vessel.orbit.semi_major_axis = 100
-        mock_conn().space_center.ut = 10
+        space_center.ut = 10
         vessel.orbit.time_to_apoapsis = 20
-        capcom = Launcher(target_altitude=200)
-        capcom.setup_circularization()
+        self.capcom.setup_circularization()
         vessel.control.add_node.assert_called_once()
         args, kargs = vessel.control.add_node.call_args
         self.assertEqual(args, (30,))
         self.assertAlmostEqual(kargs['prograde'], 0.0707, 4)
 
-    def test_execute_launch(self, mock_conn):
+    def test_execute_launch(self):
         """Should run ignition, ascent and setup_circularization."""
-        capcom = Launcher(target_altitude=10)
         with patch.object(Launcher, 'ignition'), \
                 patch.object(Launcher, 'ascent'), \
                 patch.object(Launcher, 'setup_circularization'):
-            capcom.execute_launch()
-            capcom.ignition.assert_called_once_with()
-            capcom.ascent.assert_called_once_with()
-            capcom.setup_circularization.assert_called_once_with()
+            self.capcom.execute_launch()
+            self.capcom.ignition.assert_called_once_with()
+            self.capcom.ascent.assert_called_once_with()
+            self.capcom.setup_circularization.assert_called_once_with()
 
 
 if __name__ == '__main__':
@@ -5,11 +5,66 @@ Full coverage achieved, refactoring for readability & efficiency ongoing.
 """
 
 import unittest
-from unittest.mock import patch, call
+from unittest.mock import patch, call, sentinel, Mock, MagicMock, DEFAULT
 from collections import namedtuple
+from io import StringIO
 import sys
 from NodeExecutor import NodeExecutor
 
+_Node = namedtuple('node', 'delta_v ut reference_frame remaining_delta_v')
+
+NODE0 = _Node(delta_v=10, ut=2000,
+              reference_frame=sentinel.RF, remaining_delta_v=0.1)
+NODE1 = _Node(delta_v=30, ut=4000,
+              reference_frame=sentinel.RF, remaining_delta_v=0.1)
+
+# NODE0.ut is 2000 and the tests set space_center.ut to 1980, i.e. T0-20
+_EXPECTED_ALIGN_STDOUT = 'Aligning at T0-20 seconds'
+_EXPECTED_STAGED = 'Staged at T0-20 seconds'
+_EXPECTED_EVENT_STDOUT = 'Test event happened at T0-20 seconds'
+_EXPECTED_BURN_ERROR_STDOUT = '0.01% of original dV left.'
+
+# NODE0 burns for the 4s minimum, so burn_ut is 1998 & a 10s margin is T0-12
+_EXPECTED_WARP_STDOUT = 'Warping to  T0-12 seconds'
+
+_EXPECTED_STR = 'Will burn for 10.0 m/s starting in 15.0 seconds.\n'
+_EXPECTED_REPR = 'NodeExecutor(minimum_burn_duration=10)'
+
+# (nodes, node, has_node)
+_NODE_VALUES = (((), None, False),
+                ((sentinel.node0,), sentinel.node0, True),
+                ((sentinel.node0, sentinel.node1), sentinel.node0, True), )
+
+# (value, floor, ceiling, result)
+_CLAMP_VALUES = ((-1, 0, 2, 0),
+                 (1, 2, 0, 1),
+                 (0, -1, 1, 0),
+                 (-1, -3, -2, -2), )
+
+# (fraction of delta_v left, fraction of maximum_throttle)
+_THROTTLE_VALUES = ((1, 1),
+                    (0.1, 1),
+                    (0.05, 0.5),
+                    (0.005, 0.05),
+                    (0.001, 0.05), )
+
+# (new_thrust, maximum_throttle, burn_duration_at_max_thrust, calls_made)
+_AUTO_STAGE_VALUES = ((95, 0.79, 3.1, False),
+                      (89, 0.84, 3.4, True),
+                      (50, 1.00, 6.0, True),
+                      (25, 1.00, 12.0, True), )
+
+
+def _apply_conn(conn, nodes=(NODE0,), thrust=100, isp=200, mass=30, ut=1980):
+    """Set the vessel & clock values NodeExecutor reads from the connection."""
+    space_center = conn.space_center
+    vessel = space_center.active_vessel
+    vessel.control.nodes = nodes
+    vessel.available_thrust = thrust
+    vessel.specific_impulse = isp
+    vessel.mass = mass
+    space_center.ut = ut
+
 
 class Test_environment(unittest.TestCase):
     """Test the environment to ensure it will match production."""
@@ -27,44 +82,72 @@ class Test_NodeExecutor_init(unittest.TestCase):
         - active vessel
     """
 
-    def test_no_krpc_connection(self):
+    @patch('krpc.connect', side_effect=ConnectionRefusedError)
+    def test_no_krpc_connection(self, mock_conn):
         """Server unreachable should raise ConnectionRefusedError."""
-        try:
+        with self.assertRaises(ConnectionRefusedError):
             NodeExecutor()
-        except Exception as e:
-            self.assertIsInstance(e, ConnectionRefusedError)
-        return
 
-    @patch('krpc.connect', spec=True)
+    @patch('krpc.connect')
     def test_krpc_connection(self, mock_conn):
         """Check that __init__ connects to KRPC server."""
         NodeExecutor()
         mock_conn.assert_called_once_with(name='NodeExecutor')
 
-    @patch('krpc.connect', spec=True)
+    @patch('krpc.connect')
     def test_init_minimum_burn_duration_no_karg(self, mock_conn):
         """Check that __init__ w/o karg sets minimum_burn_duration to 4."""
         Hal9000 = NodeExecutor()
         self.assertEqual(Hal9000.minimum_burn_duration, 4)
 
-    @patch('krpc.connect', spec=True)
+    @patch('krpc.connect')
     def test_init_minimum_burn_duration(self, mock_conn):
         """Check that __init__ with minimum_burn_duration karg sets it."""
         Hal9000 = NodeExecutor(minimum_burn_duration=10)
         self.assertEqual(Hal9000.minimum_burn_duration, 10)
 
-    @patch('krpc.connect', spec=True)
+    @patch('krpc.connect')
     def test_init_minimum_burn_duration_negative_value(self, mock_conn):
         """Negative value for karg should raise AssertionError."""
-        try:
+        with self.assertRaises(AssertionError):
             NodeExecutor(minimum_burn_duration=-10)
-        except Exception as e:
-            self.assertIsInstance(e, AssertionError)
-        return
 
 
-@patch('krpc.connect', spec=True)
-class Test_NodeExecutor_ro_attributes(unittest.TestCase):
+class _NodeExecutorTestCase(unittest.TestCase):
+    """
+    Share one patched KRPC connection & NodeExecutor across a test class.
+
+    Each test starts from CONN_ATTR0 & the default minimum_burn_duration.
+    """
+
+    CONN_ATTR0 = {}
+
+    @classmethod
+    def setUpClass(cls):
+        """Patch the KRPC server connection & create a shared NodeExecutor."""
+        cls.patcher = patch('krpc.connect')
+        cls.mock_conn = cls.patcher.start()
+        cls.conn = cls.mock_conn.return_value
+        _apply_conn(cls.conn, **cls.CONN_ATTR0)
+        try:
+            cls.Hal9000 = NodeExecutor()
+        except Exception:
+            cls.patcher.stop()
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the patch on the KRPC server connection."""
+        cls.patcher.stop()
+
+    def setUp(self):
+        """Reset the shared connection mock & NodeExecutor to the defaults."""
+        self.mock_conn.reset_mock()
+        _apply_conn(self.conn, **self.CONN_ATTR0)
+        self.Hal9000.minimum_burn_duration = 4
+
+
+class Test_NodeExecutor_ro_attributes(_NodeExecutorTestCase):
     """
     Test the NodeExecutor class read-only attributes.
 
@@ -72,131 +155,67 @@ class Test_NodeExecutor_ro_attributes(unittest.TestCase):
         - active vessel
     """
 
-    def setUp(self):
-        """Set up the mock objects."""
-        node = namedtuple('node', 'delta_v ut')
-        self.NODE0 = node(delta_v=10, ut=20)
-        self.NODE1 = node(delta_v=30, ut=40)
-
-        self.CONN_ATTR0 = {
-            'space_center.active_vessel.control.nodes': (self.NODE0,
-                                                         self.NODE1),
-            'space_center.active_vessel.available_thrust': 100,
-            'space_center.active_vessel.specific_impulse': 200,
-            'space_center.active_vessel.mass': 300,
-            'space_center.ut': 1980}
-
-        self.CONN_ATTR1 = {
-            'space_center.active_vessel.control.nodes': (self.NODE1,),
-            'space_center.active_vessel.available_thrust': 200000,
-            'space_center.active_vessel.specific_impulse': 800,
-            'space_center.active_vessel.mass': 40000000,
-            'space_center.ut': 1980}
-
-        self.burn_duration0 = 29.9
-        self.burn_duration1 = 5988.6
-
-    def tearDown(self):
-        """Delete the mock objects."""
-        del(self.NODE0)
-        del(self.NODE1)
-
-        del(self.CONN_ATTR0)
-        del(self.CONN_ATTR1)
-
-        del(self.burn_duration0)
-        del(self.burn_duration1)
-
-    def test_node(self, mock_conn):
-        """Check that node is the first node from active vessel."""
-        control = mock_conn().space_center.active_vessel.control
-
-        with self.subTest('zero nodes'):
-            control.nodes = ()
-            Hal9000 = NodeExecutor()
-            self.assertEqual(Hal9000.node, None)
-
-        with self.subTest('one node'):
-            control.nodes = (self.NODE0,)
-            Hal9000 = NodeExecutor()
-            self.assertEqual(Hal9000.node, self.NODE0)
-
-        with self.subTest('two nodes'):
-            control.nodes = (self.NODE0, self.NODE1)
-            Hal9000 = NodeExecutor()
-            self.assertEqual(Hal9000.node, self.NODE0)
-
-    def test_has_node(self, mock_conn):
-        """Active vessel without nodes should set has_node to False."""
-        control = mock_conn().space_center.active_vessel.control
-
-        with self.subTest('zero nodes'):
-            control.nodes = ()
-            Hal9000 = NodeExecutor()
-            self.assertEqual(Hal9000.has_node, False)
-
-        with self.subTest('one node'):
-            control.nodes = (self.NODE0,)
-            Hal9000 = NodeExecutor()
-            self.assertEqual(Hal9000.has_node, True)
-
-        with self.subTest('two nodes'):
-            control.nodes = (self.NODE0, self.NODE1)
-            Hal9000 = NodeExecutor()
-            self.assertEqual(Hal9000.has_node, True)
-
-    def test_delta_v(self, mock_conn):
+    CONN_ATTR0 = {'nodes': (NODE0, NODE1), 'thrust': 100,
+                  'isp': 200, 'mass': 300, 'ut': 1980}
+
+    CONN_ATTR1 = {'nodes': (NODE1,), 'thrust': 200000,
+                  'isp': 800, 'mass': 40000000, 'ut': 1980}
+
+    burn_duration0 = 29.9
+    burn_duration1 = 5988.6
+
+    def test_node_and_has_node(self):
+        """Check node is the first node from active vessel, if it has one."""
+        control = self.conn.space_center.active_vessel.control
+
+        for nodes, node, has_node in _NODE_VALUES:
+            with self.subTest(f'{len(nodes)} nodes'):
+                control.nodes = nodes
+                self.assertIs(self.Hal9000.node, node)
+                self.assertIs(self.Hal9000.has_node, has_node)
+
+    def test_delta_v(self):
         """Check that delta_v is set from the node."""
-        mock_conn().configure_mock(**self.CONN_ATTR0)
-        Hal9000 = NodeExecutor()
-        self.assertEqual(Hal9000.delta_v, self.NODE0.delta_v)
+        self.assertEqual(self.Hal9000.delta_v, NODE0.delta_v)
 
-    def test_burn_duration_at_max_thrust(self, mock_conn):
+    def test_burn_duration_at_max_thrust(self):
         """Node should set burn_duration_at_max_thrust."""
         with self.subTest('first set of values'):
-            mock_conn().configure_mock(**self.CONN_ATTR0)
-            Hal9000 = NodeExecutor()
-            self.assertAlmostEqual(Hal9000.burn_duration_at_max_thrust,
+            self.assertAlmostEqual(self.Hal9000.burn_duration_at_max_thrust,
                                    self.burn_duration0, 1)
 
         with self.subTest('second set of values'):
-            mock_conn().configure_mock(**self.CONN_ATTR1)
-            Hal9000 = NodeExecutor()
-            self.assertAlmostEqual(Hal9000.burn_duration_at_max_thrust,
+            _apply_conn(self.conn, **self.CONN_ATTR1)
+            self.assertAlmostEqual(self.Hal9000.burn_duration_at_max_thrust,
                                    self.burn_duration1, 1)
 
-    def test_maximum_throttle_and_burn_duration(self, mock_conn):
+    def test_maximum_throttle_and_burn_duration(self):
         """Setting minimum_burn_duration should set burn throttle, duration."""
-        mock_conn().configure_mock(**self.CONN_ATTR0)
-
         with self.subTest('burn time greater than minimum'):
-            Hal9000 = NodeExecutor(minimum_burn_duration=self.burn_duration0/2)
-            self.assertEqual(Hal9000.maximum_throttle, 1)
-            self.assertEqual(Hal9000.burn_duration,
-                             Hal9000.burn_duration_at_max_thrust)
+            self.Hal9000.minimum_burn_duration = self.burn_duration0/2
+            self.assertEqual(self.Hal9000.maximum_throttle, 1)
+            self.assertEqual(self.Hal9000.burn_duration,
+                             self.Hal9000.burn_duration_at_max_thrust)
 
         with self.subTest('no minimum'):
-            Hal9000 = NodeExecutor(minimum_burn_duration=0)
-            self.assertEqual(Hal9000.maximum_throttle, 1)
-            self.assertAlmostEqual(Hal9000.burn_duration,
-                                   Hal9000.burn_duration_at_max_thrust)
+            self.Hal9000.minimum_burn_duration = 0
+            self.assertEqual(self.Hal9000.maximum_throttle, 1)
+            self.assertAlmostEqual(self.Hal9000.burn_duration,
+                                   self.Hal9000.burn_duration_at_max_thrust)
 
         with self.subTest('burn time less than minimum'):
-            Hal9000 = NodeExecutor(minimum_burn_duration=self.burn_duration0*2)
-            self.assertAlmostEqual(Hal9000.maximum_throttle, 0.5, 3)
-            self.assertEqual(Hal9000.burn_duration,
-                             Hal9000.minimum_burn_duration)
+            self.Hal9000.minimum_burn_duration = self.burn_duration0*2
+            self.assertAlmostEqual(self.Hal9000.maximum_throttle, 0.5, 3)
+            self.assertEqual(self.Hal9000.burn_duration,
+                             self.Hal9000.minimum_burn_duration)
 
-    def test_burn_ut(self, mock_conn):
+    def test_burn_ut(self):
         """Check that burn_ut is set properly."""
-        mock_conn().configure_mock(**self.CONN_ATTR0)
-        Hal9000 = NodeExecutor()
         self.assertAlmostEqual(
-            Hal9000.burn_ut, self.NODE0.ut - Hal9000.burn_duration/2)
+            self.Hal9000.burn_ut, NODE0.ut - self.Hal9000.burn_duration/2)
 
 
-@patch('krpc.connect', spec=True)
-class Test_NodeExecutor_methods(unittest.TestCase):
+class Test_NodeExecutor_methods(_NodeExecutorTestCase):
     """
     Test the NodeExecutor public methods.
 
@@ -204,137 +223,109 @@ class Test_NodeExecutor_methods(unittest.TestCase):
         - active vessel
     """
 
-    def setUp(self):
-        """Set up the mock objects."""
-        node = namedtuple(
-            'node', 'delta_v ut reference_frame remaining_delta_v')
-        self.NODE0 = node(delta_v=10, ut=2000,
-                          reference_frame='RF', remaining_delta_v=0.1)
-        self.CONN_ATTRS = {
-            'space_center.active_vessel.control.nodes': (self.NODE0,),
-            'space_center.active_vessel.available_thrust': 100,
-            'space_center.active_vessel.specific_impulse': 200,
-            'space_center.active_vessel.mass': 30,
-            'space_center.ut': 1980}
-
-    def tearDown(self):
-        """Delete the mock objects."""
-        del(self.NODE0)
-        del(self.CONN_ATTRS)
-
     @patch('NodeExecutor.time', spec=True)
-    @patch('sys.stdout', spec=True)
-    def test_align_to_burn(self, mock_stdout, mock_time, mock_conn):
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_align_to_burn(self, mock_stdout, mock_time):
         """Check that align_to_burn sets up and engages the autopilot."""
-        mock_conn().configure_mock(**self.CONN_ATTRS)
-
-        Hal9000 = NodeExecutor()
-        auto_pilot = mock_conn().space_center.active_vessel.auto_pilot
+        auto_pilot = self.conn.space_center.active_vessel.auto_pilot
 
-        Hal9000.align_to_burn()
+        self.Hal9000.align_to_burn()
 
         with self.subTest('sets the auto_pilot attributes'):
             actual_ref = auto_pilot.reference_frame
             actual_dir = auto_pilot.target_direction
             actual_rol = auto_pilot.target_roll
-            self.assertEqual(actual_ref, self.NODE0.reference_frame)
+            self.assertIs(actual_ref, NODE0.reference_frame)
             self.assertEqual(actual_dir, (0, 1, 0))
             self.assertNotEqual(actual_rol, actual_rol, 'Expected NaN')
 
         with self.subTest('engages auto_pilot & waits for alignment'):
-            CONN_CALLS = [call.engage(), call.wait()]
-            auto_pilot.assert_has_calls(CONN_CALLS)
+            auto_pilot.engage.assert_called_once_with()
+            auto_pilot.wait.assert_called_once_with()
 
         with self.subTest('writes message to stdout'):
-            T0 = self.NODE0.ut - self.CONN_ATTRS['space_center.ut']
-            STDOUT_CALLS = [call(f'Aligning at T0-{T0:.0f} seconds')]
-            mock_stdout.write.assert_has_calls(STDOUT_CALLS)
+            self.assertEqual(mock_stdout.getvalue(),
+                             _EXPECTED_ALIGN_STDOUT + '\n')
 
-    @patch('sys.stdout', spec=True)
-    def test_warp_safely_to_burn(self, mock_stdout, mock_conn):
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_warp_safely_to_burn(self, mock_stdout):
         """Check that warp_safely_to_burn calls warp_to() only if necessary."""
-        mock_conn().configure_mock(**self.CONN_ATTRS)
         MARGIN = 10
-        Hal9000 = NodeExecutor()
-        BURN_UT = Hal9000.burn_ut
-        space_center = mock_conn().space_center
+        BURN_UT = self.Hal9000.burn_ut
+        space_center = self.conn.space_center
 
         with self.subTest('node already past'):
             space_center.ut = BURN_UT
-            Hal9000.warp_safely_to_burn(margin=MARGIN)
+            self.Hal9000.warp_safely_to_burn(margin=MARGIN)
             space_center.warp_to.assert_not_called()
-            mock_stdout.write.assert_not_called()
+            self.assertEqual(mock_stdout.getvalue(), '')
 
         with self.subTest('node is now'):
             space_center.ut = BURN_UT - MARGIN
-            Hal9000.warp_safely_to_burn(margin=MARGIN)
+            self.Hal9000.warp_safely_to_burn(margin=MARGIN)
             space_center.warp_to.assert_not_called()
-            mock_stdout.write.assert_not_called()
+            self.assertEqual(mock_stdout.getvalue(), '')
 
         with self.subTest('node still in future'):
             space_center.ut = BURN_UT - MARGIN - 1
-            Hal9000.warp_safely_to_burn(margin=MARGIN)
+            self.Hal9000.warp_safely_to_burn(margin=MARGIN)
             space_center.warp_to.assert_called_with(BURN_UT - MARGIN)
-            T0 = self.NODE0.ut - BURN_UT + MARGIN
-            STDOUT_CALLS = [call(f'Warping to  T0-{T0:.0f} seconds')]
-            mock_stdout.write.assert_has_calls(STDOUT_CALLS)
-
-    def test_wait_until_ut(self, mock_conn):
-        """Should not call time.sleep if ut already past."""
-        Hal9000 = NodeExecutor()
+            self.assertEqual(mock_stdout.getvalue(),
+                             _EXPECTED_WARP_STDOUT + '\n')
 
-        with patch('NodeExecutor.time', spec=True) as mock_time:
-            mock_conn().space_center.ut = 100
-            Hal9000.wait_until_ut(ut_threshold=10)
+    @patch('NodeExecutor.time', spec=True)
+    def test_wait_until_ut(self, mock_time):
+        """Should sleep until ut reaches the threshold, not at all if past."""
+        space_center = self.conn.space_center
+
+        def _advance_ut_once(seconds):
+            if mock_time.sleep.call_count > 1:
+                raise AssertionError('ut was not re-read after sleeping')
+            space_center.ut = 100
+
+        with self.subTest('ut already past'):
+            space_center.ut = 100
+            self.Hal9000.wait_until_ut(ut_threshold=10)
             mock_time.sleep.assert_not_called()
 
-        with patch('time.sleep', spec=True, side_effect=StopIteration):
-            mock_conn().space_center.ut = 10
-            called = False
-            try:
-                Hal9000.wait_until_ut(ut_threshold=100)
-            except StopIteration:
-                called = True
-            self.assertTrue(called)
+        with self.subTest('ut reached after one sleep'):
+            space_center.ut = 10
+            mock_time.sleep.side_effect = _advance_ut_once
+            self.Hal9000.wait_until_ut(ut_threshold=100)
+            mock_time.sleep.assert_called_once_with(0.01)
 
-    def test_burn_baby_burn(self, mock_conn):
+    def test_burn_baby_burn(self):
         """Check it sets up, executes, and cleans up the burn loop."""
-        mock_conn().configure_mock(**self.CONN_ATTRS)
-        Hal9000 = NodeExecutor()
-        dV_left = self.NODE0.delta_v
-        remaining_delta_v = self.NODE0.remaining_delta_v
-        mock_conn().stream().__enter__().return_value = dV_left
-        with patch.object(NodeExecutor, '_print_burn_event'):
-            with patch.object(NodeExecutor, '_burn_loop'):
-                with patch.object(NodeExecutor, '_print_burn_error'):
-                    with patch.object(NodeExecutor, '_cleanup'):
-                        Hal9000.burn_baby_burn()
-                        Hal9000._cleanup.assert_called_once_with()
-                    Hal9000._print_burn_error.assert_called_once_with(
-                        remaining_delta_v)
-                Hal9000._burn_loop.assert_called_once_with()
-            calls = [call('Ignition'), call('MECO')]
-            Hal9000._print_burn_event.assert_has_calls(calls)
-
-    def test_execute_node(self, mock_conn):
+        remaining_delta_v = NODE0.remaining_delta_v
+        with patch.multiple(NodeExecutor,
+                            _print_burn_event=DEFAULT,
+                            _burn_loop=DEFAULT,
+                            _print_burn_error=DEFAULT,
+                            _cleanup=DEFAULT) as mocks:
+            self.Hal9000.burn_baby_burn()
+        mocks['_cleanup'].assert_called_once_with()
+        mocks['_print_burn_error'].assert_called_once_with(remaining_delta_v)
+        mocks['_burn_loop'].assert_called_once_with()
+        calls = [call('Ignition'), call('MECO')]
+        mocks['_print_burn_event'].assert_has_calls(calls)
+
+    def test_execute_node(self):
         """Should gradually approach node, and call burn_baby_burn()."""
-        mock_conn().configure_mock(**self.CONN_ATTRS)
-        Hal9000 = NodeExecutor()
-        with patch.object(NodeExecutor, 'burn_baby_burn'):
-            with patch.object(NodeExecutor, 'wait_until_ut'):
-                with patch.object(NodeExecutor, 'warp_safely_to_burn'):
-                    with patch.object(NodeExecutor, 'align_to_burn'):
-                        Hal9000.execute_node()
-                        calls = [call(), call()]
-                        Hal9000.align_to_burn.assert_has_calls(calls)
-                    calls = [call(margin=180), call(margin=5)]
-                    Hal9000.warp_safely_to_burn.assert_has_calls(calls)
-                Hal9000.wait_until_ut.assert_called_once_with(Hal9000.burn_ut)
-            Hal9000.burn_baby_burn.assert_called_once_with()
-
-
-@patch('krpc.connect', spec=True)
-class Test_NodeExecutor_private_methods(unittest.TestCase):
+        with patch.multiple(NodeExecutor,
+                            burn_baby_burn=DEFAULT,
+                            wait_until_ut=DEFAULT,
+                            warp_safely_to_burn=DEFAULT,
+                            align_to_burn=DEFAULT) as mocks:
+            self.Hal9000.execute_node()
+        self.assertEqual(mocks['align_to_burn'].call_args_list,
+                         [call(), call()])
+        calls = [call(margin=180), call(margin=5)]
+        mocks['warp_safely_to_burn'].assert_has_calls(calls)
+        mocks['wait_until_ut'].assert_called_once_with(self.Hal9000.burn_ut)
+        mocks['burn_baby_burn'].assert_called_once_with()
+
+
+class Test_NodeExecutor_private_methods(_NodeExecutorTestCase):
     """
     Test the NodeExecutor class private methods.
 
@@ -343,160 +334,124 @@ class Test_NodeExecutor_private_methods(unittest.TestCase):
     """
 
     def setUp(self):
-        """Set up the mock objects."""
-        node = namedtuple('node', 'delta_v ut reference_frame')
-        self.NODE0 = node(delta_v=10, ut=2000, reference_frame='RF')
-        self.CONN_ATTRS = {
-            'space_center.active_vessel.control.nodes': (self.NODE0,),
-            'space_center.active_vessel.available_thrust': 100,
-            'space_center.active_vessel.specific_impulse': 200,
-            'space_center.active_vessel.mass': 30,
-            'space_center.ut': 1980}
-
-    def tearDown(self):
-        """Delete the mock objects."""
-        del(self.NODE0)
-        del(self.CONN_ATTRS)
-
-    def test__clamp(self, mock_conn):
-        """Should clamp the value between ceiling and floor."""
-        Hal9000 = NodeExecutor()
+        """Reset the shared fixture & patch time for each test."""
+        super().setUp()
+        patcher = patch('NodeExecutor.time', spec=True)
+        self.mock_time = patcher.start()
+        self.addCleanup(patcher.stop)
 
-        values = [[-1, 0, 2, 0], [1, 2, 0, 1],
-                  [0, -1, 1, 0], [-1, -3, -2, -2], ]
-
-        for value, floor, ceiling, result in values:
-            self.assertEqual(Hal9000._clamp(value, floor, ceiling), result)
+    def test__clamp(self):
+        """Should clamp the value between ceiling and floor."""
+        for value, floor, ceiling, result in _CLAMP_VALUES:
+            with self.subTest(value=value, floor=floor, ceiling=ceiling):
+                self.assertEqual(
+                    self.Hal9000._clamp(value, floor, ceiling), result)
 
-    def test__throttle_manager(self, mock_conn):
+    def test__throttle_manager(self):
         """Should decrease throttle linearly towards end of burn."""
-        mock_conn().configure_mock(**self.CONN_ATTRS)
-        Hal9000 = NodeExecutor()
-        control = mock_conn().space_center.active_vessel.control
-
-        values = [[1, 1], [0.1, 1], [0.05, 0.5],
-                  [0.005, 0.05], [0.001, 0.05], ]
+        control = self.conn.space_center.active_vessel.control
+        maximum_throttle = self.Hal9000.maximum_throttle
 
-        for value, result in values:
-            Hal9000._throttle_manager(self.NODE0.delta_v * value)
-            self.assertAlmostEqual(
-                control.throttle, result * Hal9000.maximum_throttle)
+        for value, result in _THROTTLE_VALUES:
+            with self.subTest(value=value):
+                self.Hal9000._throttle_manager(NODE0.delta_v * value)
+                self.assertAlmostEqual(control.throttle,
+                                       result * maximum_throttle)
 
-    @patch('NodeExecutor.time', spec=True)
-    @patch('sys.stdout', spec=True)
-    def test__auto_stage(self, mock_stdout, mock_time, mock_conn):
+    @patch('sys.stdout', new_callable=StringIO)
+    def test__auto_stage(self, mock_stdout):
         """Should autostage if thrust drops 10% or more."""
-        mock_conn().configure_mock(**self.CONN_ATTRS)
-        Hal9000 = NodeExecutor()
-        vessel = mock_conn().space_center.active_vessel
+        vessel = self.conn.space_center.active_vessel
         control = vessel.control
+        mock_time = self.mock_time
 
-        VALUES = [[95, 0.79, 3.1, False],
-                  [89, 0.84, 3.4, True],
-                  [50, 1.00, 6.0, True],
-                  [25, 1.00, 12.0, True], ]
-
-        for new_thrust, throttle, burn_duration, calls_made in VALUES:
+        for new_thrust, throttle, duration, calls_made in _AUTO_STAGE_VALUES:
             with self.subTest(f'thrust_ratio: {new_thrust}%'):
-                mock_conn().reset_mock()
-                mock_stdout.reset_mock()
-                mock_time.reset_mock()
+                control.activate_next_stage = Mock()
+                mock_stdout.seek(0)
+                mock_stdout.truncate()
+                mock_time.sleep = Mock()
                 vessel.available_thrust = new_thrust
-                self.assertEqual(Hal9000._auto_stage(100), new_thrust)
-                self.assertAlmostEqual(Hal9000.maximum_throttle, throttle, 2)
+                self.assertEqual(self.Hal9000._auto_stage(100), new_thrust)
                 self.assertAlmostEqual(
-                    Hal9000.burn_duration_at_max_thrust, burn_duration, 1)
+                    self.Hal9000.maximum_throttle, throttle, 2)
+                self.assertAlmostEqual(
+                    self.Hal9000.burn_duration_at_max_thrust, duration, 1)
                 if calls_made:
                     control.activate_next_stage.assert_called_once_with()
-                    mock_stdout.write.assert_has_calls(
-                        [call(f'Staged at T0-20 seconds')])
+                    self.assertEqual(mock_stdout.getvalue(),
+                                     _EXPECTED_STAGED + '\n')
                     mock_time.sleep.assert_has_calls([call(0.1), call(0.1)])
                 else:
-                    mock_stdout.write.assert_not_called()
+                    self.assertEqual(mock_stdout.getvalue(), '')
                     mock_time.sleep.assert_not_called()
 
-    def test__cleanup(self, mock_conn):
+    def test__cleanup(self):
         """Should call disengage() on autopilot & remove() on node."""
-        Hal9000 = NodeExecutor()
-        vessel = mock_conn().space_center.active_vessel
+        vessel = self.conn.space_center.active_vessel
+        node = Mock()
+        vessel.control.nodes = (node,)
 
         vessel.auto_pilot.disengage.assert_not_called()
-        vessel.control.nodes[0].remove.assert_not_called()
-        Hal9000._cleanup()
+        node.remove.assert_not_called()
+        self.Hal9000._cleanup()
         vessel.auto_pilot.disengage.assert_called_once_with()
-        vessel.control.nodes[0].remove.assert_called_once_with()
+        node.remove.assert_called_once_with()
 
-    def test__is_burn_complete(self, mock_conn):
+    def test__is_burn_complete(self):
         """Check returns True when it's time to shut down the engines."""
-        Hal9000 = NodeExecutor()
-        self.assertFalse(Hal9000._is_burn_complete(error=10))
-        self.assertTrue(Hal9000._is_burn_complete(error=30))
+        self.assertFalse(self.Hal9000._is_burn_complete(error=10))
+        self.assertTrue(self.Hal9000._is_burn_complete(error=30))
 
-    def test__print_burn_event(self, mock_conn):
+    @patch('sys.stdout', new_callable=StringIO)
+    def test__print_burn_event(self, mock_stdout):
         """Should print to stdout with the time to T0 appended."""
-        mock_conn().configure_mock(**self.CONN_ATTRS)
-        TEST_MSG = 'Test event happened'
-        STDOUT_CALLS = [call(f'Test event happened at T0-20 seconds')]
-        Hal9000 = NodeExecutor()
-        with patch('sys.stdout', spec=True) as mock_stdout:
-            Hal9000._print_burn_event(TEST_MSG)
-            mock_stdout.write.assert_has_calls(STDOUT_CALLS)
+        self.Hal9000._print_burn_event('Test event happened')
+        self.assertEqual(mock_stdout.getvalue(),
+                         _EXPECTED_EVENT_STDOUT + '\n')
 
-    def test__burn_loop(self, mock_conn):
+    def test__burn_loop(self):
         """Should manage throttle during burn, with staging."""
         def _false_once_then_true():
             yield False
             while True:
                 yield True
 
-        mock_conn().configure_mock(**self.CONN_ATTRS)
-        Hal9000 = NodeExecutor()
         dV_left = 100
-        mock_conn().space_center.active_vessel.auto_pilot.error = 0
-        mock_conn().stream().__enter__().return_value = dV_left
-        with patch.object(NodeExecutor, '_is_burn_complete',
-                          side_effect=_false_once_then_true(),), \
-                patch.object(NodeExecutor, '_throttle_manager'), \
-                patch.object(NodeExecutor, '_auto_stage'), \
-                patch.object(NodeExecutor, '_wait_to_go_around_again'):
-            Hal9000._burn_loop()
-            Hal9000._wait_to_go_around_again.assert_called_once_with()
-            Hal9000._auto_stage.assert_called_once_with(Hal9000.thrust)
-            Hal9000._throttle_manager.assert_called_once_with(dV_left)
-            Hal9000._is_burn_complete.assert_has_calls(
-                [call(dV_left), call(dV_left)])
-
-    def test__print_burn_error(self, mock_conn):
+        self.conn.space_center.active_vessel.auto_pilot.error = 0
+        stream_ctx = self.conn.stream.return_value.__enter__.return_value
+        stream_ctx.return_value = dV_left
+        is_burn_complete = MagicMock(side_effect=_false_once_then_true())
+        with patch.multiple(NodeExecutor,
+                            _is_burn_complete=is_burn_complete,
+                            _throttle_manager=DEFAULT,
+                            _auto_stage=DEFAULT,
+                            _wait_to_go_around_again=DEFAULT) as mocks:
+            self.Hal9000._burn_loop()
+        mocks['_wait_to_go_around_again'].assert_called_once_with()
+        mocks['_auto_stage'].assert_called_once_with(self.Hal9000.thrust)
+        mocks['_throttle_manager'].assert_called_once_with(dV_left)
+        is_burn_complete.assert_has_calls([call(dV_left), call(dV_left)])
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test__print_burn_error(self, mock_stdout):
         """Check that the remaining deltaV is printed to stdout."""
-        mock_conn().configure_mock(**self.CONN_ATTRS)
-        Hal9000 = NodeExecutor()
-        dV_left = 0.1
-        STDOUT_CALLS = [
-            call(f'{(dV_left/Hal9000.delta_v):2.2f}% of original dV left.')]
-        with patch('sys.stdout', spec=True) as mock_stdout:
-            Hal9000._print_burn_error(dV_left)
-            mock_stdout.write.assert_has_calls(STDOUT_CALLS)
-
-    def test__wait_to_go_around_again(self, mock_conn):
-        """Check it calls time.sleep() for 10 ms."""
-        Hal9000 = NodeExecutor()
+        self.Hal9000._print_burn_error(0.1)
+        self.assertEqual(mock_stdout.getvalue(),
+                         _EXPECTED_BURN_ERROR_STDOUT + '\n')
 
-        with patch('NodeExecutor.time', spec=True) as mock_time:
-            Hal9000._wait_to_go_around_again()
-            mock_time.sleep.assert_called_once_with(0.01)
+    def test__wait_to_go_around_again(self):
+        """Check it calls time.sleep() for 10 ms."""
+        self.Hal9000._wait_to_go_around_again()
+        self.mock_time.sleep.assert_called_once_with(0.01)
 
-    def test___str__(self, mock_conn):
-        """Check that the __str__() method works."""
-        mock_conn().configure_mock(**self.CONN_ATTRS)
-        actual_str = str(NodeExecutor(minimum_burn_duration=10))
-        expect_str = 'Will burn for 10.0 m/s starting in 15.0 seconds.\n'
-        self.assertEqual(actual_str, expect_str)
-
-    def test___repr__(self, mock_conn):
-        """Check that the __repr__() method works."""
-        actual_str = repr(NodeExecutor(minimum_burn_duration=10))
-        expect_str = 'NodeExecutor(minimum_burn_duration=10)'
-        self.assertEqual(actual_str, expect_str)
+    def test_string_representations(self):
+        """Check that the __str__() & __repr__() methods work."""
+        Hal9000 = NodeExecutor(minimum_burn_duration=10)
+        with self.subTest('__str__'):
+            self.assertEqual(str(Hal9000), _EXPECTED_STR)
+        with self.subTest('__repr__'):
+            self.assertEqual(repr(Hal9000), _EXPECTED_REPR)
 
 
 if __name__ == '__main__':